@@ -1,11 +1,92 @@
 import json  # Import the json module for working with JSON data
+import mmap  # Import mmap to read exported completion history without loading it into memory
+import os  # Import os to check the size of an exported file before mapping it
+import struct  # Import struct to pack and unpack the binary export header
+import sys  # Import sys to check the byte order of the running platform
+from array import array  # Import array to build compact fixed-width columns
+from contextlib import contextmanager  # Import contextmanager to manage the memory-mapped reader
 from datetime import datetime, timedelta  # Import datetime and timedelta to handle dates and times
 
+# Binary export format for completion history:
+# a 12-byte header (magic, version, record count) followed by three columns stored one after another:
+# habit_id (uint32), date_ordinal (uint32) and periodicity_type (uint8), all little-endian.
+EXPORT_MAGIC = b'HBTC'
+EXPORT_VERSION = 1
+EXPORT_HEADER = struct.Struct('<4sHxxI')
+
+# Codes used for the periodicity_type column of the export
+PERIODICITY_CODES = {"daily": 0, "weekly": 1, "monthly": 2, "yearly": 3}
+
 # Function to get the start of the week (Monday)
 def start_of_week(date):
     """Given a date, return the start of that week (Monday)."""
     return date - timedelta(days=date.weekday())  # Subtract days from the given date to get Monday
 
+# Function to pick the array typecode for the 4-byte unsigned integer columns
+def uint32_typecode():
+    """Return the array typecode holding 4-byte unsigned integers, shared by the export writer and reader."""
+    for typecode in ('I', 'L'):
+        if array(typecode).itemsize == 4:
+            return typecode
+    raise RuntimeError("This platform has no 4-byte unsigned integer type for the completion history export.")
+
+# Function to read an exported completion history file
+@contextmanager
+def read_completions(path='completions.bin'):
+    """
+    Memory-map an exported completion history file and yield its columns.
+
+    Yields a dict with 'habit_id', 'date_ordinal' and 'periodicity_type' keys, each a
+    sequence of integers of the same length. The columns are only valid inside the 'with' block.
+    Raises ValueError if the file is not a complete, supported export.
+    """
+    typecode = uint32_typecode()
+    invalid_message = f"'{path}' is not a supported completion history export."
+
+    with open(path, 'rb') as file:
+        # Reject files too short for a header before mapping them (mmap also refuses empty files)
+        if os.fstat(file.fileno()).st_size < EXPORT_HEADER.size:
+            raise ValueError(invalid_message)
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    columns = {}
+    try:
+        magic, version, count = EXPORT_HEADER.unpack_from(view)
+        if magic != EXPORT_MAGIC or version != EXPORT_VERSION:
+            raise ValueError(invalid_message)
+
+        # Locate each column after the header
+        ids_start = EXPORT_HEADER.size
+        ordinals_start = ids_start + 4 * count
+        types_start = ordinals_start + 4 * count
+        if len(view) < types_start + count:
+            raise ValueError(invalid_message)
+
+        columns['habit_id'] = view[ids_start:ordinals_start].cast(typecode)
+        columns['date_ordinal'] = view[ordinals_start:types_start].cast(typecode)
+        columns['periodicity_type'] = view[types_start:types_start + count]
+
+        if sys.byteorder == 'big':
+            # Columns are stored little-endian, so swap them into copies on big-endian platforms
+            for key in ('habit_id', 'date_ordinal'):
+                column = array(typecode, columns[key])
+                column.byteswap()
+                columns[key].release()
+                columns[key] = column
+
+        yield columns
+    finally:
+        # Release every view on the mapping before closing it
+        try:
+            for column in columns.values():
+                if isinstance(column, memoryview):
+                    column.release()
+            view.release()
+            mapped.close()
+        except BufferError:
+            # The caller still holds views derived from the columns, so leave the mapping for garbage collection
+            pass
+
 """
 Class for managing user habits.
 
@@ -26,6 +107,7 @@ Methods:
     analyze_habits: Analyze and display information about the user's habits.
     get_period_start: Calculate the start of a period based on the periodicity type.
     prompt_for_frequency: Prompt for the frequency of the habit (e.g., times per week).
+    export_completions: Export completion history as flat binary columns for external analytics.
 """
 
 class HabitTracker:
@@ -76,10 +158,11 @@ class HabitTracker:
             print("3. Edit Existing Habit")
             print("4. Habit Analysis")
             print("5. Check Off Habit")
-            print("6. Exit\n")
+            print("6. Export Completion History")
+            print("7. Exit\n")
 
             # Prompt the user to choose an option
-            choice = input("Enter your choice (1-6): ")
+            choice = input("Enter your choice (1-7): ")
 
             # Call the appropriate method based on the user's choice
             if choice == "1":
@@ -93,6 +176,8 @@ class HabitTracker:
             elif choice == "5":
                 self.check_off_habit()  # Check off a habit for today
             elif choice == "6":
+                self.export_completions()  # Export completion history for analytics
+            elif choice == "7":
                 # Exit the app and save the user's habits
                 print("Exiting...")
                 self.save_habits()
@@ -465,3 +550,40 @@ class HabitTracker:
             except ValueError:
                 # Handle the case where the input is not a valid integer
                 print("Invalid input. Please enter a valid number.")
+
+    def export_completions(self, path='completions.bin'):
+        """
+        Export completion history as flat columns to a binary file.
+
+        Each completed date becomes one row with the habit's index in the habit list,
+        the date's proleptic Gregorian ordinal and the periodicity code. Use read_completions to read it back.
+        """
+        try:
+            typecode = uint32_typecode()
+            habit_ids = array(typecode)
+            date_ordinals = array(typecode)
+            periodicity_types = array('B')
+
+            # Flatten the completed dates of every habit into the three columns
+            for habit_id, habit in enumerate(self.habits_test):
+                periodicity_code = PERIODICITY_CODES[habit['periodicity_type']]
+                for date_str in habit['completed_dates']:
+                    habit_ids.append(habit_id)
+                    date_ordinals.append(datetime.strptime(date_str, '%Y-%m-%d').toordinal())
+                    periodicity_types.append(periodicity_code)
+
+            if sys.byteorder == 'big':
+                # Store columns little-endian regardless of the platform
+                habit_ids.byteswap()
+                date_ordinals.byteswap()
+
+            with open(path, 'wb') as file:
+                file.write(EXPORT_HEADER.pack(EXPORT_MAGIC, EXPORT_VERSION, len(habit_ids)))
+                habit_ids.tofile(file)
+                date_ordinals.tofile(file)
+                periodicity_types.tofile(file)
+        except Exception as e:
+            print(f"An error occurred while exporting completion history: {e}")
+            return
+
+        print(f"Exported {len(habit_ids)} completions to '{path}'.")
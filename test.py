@@ -1,6 +1,8 @@
+import os  # Import os to build paths for temporary export files
+import tempfile  # Import tempfile to write exports outside the project directory
 import unittest  # Import the unittest module for testing
 from datetime import datetime  # Import datetime to work with dates
-from habit_tracker_app import HabitTracker  # Import the HabitTracker class to test its functionalities
+from habit_tracker_app import HabitTracker, read_completions  # Import the HabitTracker class and export reader to test their functionalities
 
 """
 Test class for the Habit Tracker application.
@@ -17,6 +19,11 @@ Methods:
     test_edit_habit: Test editing an existing habit's details.
     test_check_off_habit: Test checking off a habit for today.
     test_analyze_habits: Test analyzing and summarizing the user's habits.
+    test_export_completions: Test exporting completion history and reading it back.
+    test_export_completions_invalid_habit: Test exporting habits with invalid data reports an error.
+    test_read_completions_keeps_derived_views: Test a column slice kept past the reader does not break cleanup.
+    test_read_completions_propagates_errors: Test errors raised inside the reader are not replaced.
+    test_read_completions_invalid_files: Test invalid export files raise ValueError.
 """
 
 class TestHabitTracker(unittest.TestCase):
@@ -155,6 +162,113 @@ class TestHabitTracker(unittest.TestCase):
         # Run the analysis method
         self.tracker.analyze_habits()  # This should print the analysis summary for each habit
 
+    def test_export_completions(self):
+        """Test exporting completion history and reading it back."""
+
+        # Use a known habit list for the export
+        self.tracker.habits_test = [
+            {
+                'name': "Daily Habit",
+                'periodicity': 1,
+                'periodicity_display': "Daily",
+                'periodicity_type': "daily",
+                'specification': "Export habit 1",
+                'completed_dates': ["2024-11-04", "2024-11-05"],
+                'current_streak': 2,
+                'longest_streak': 2
+            },
+            {
+                'name': "Monthly Habit",
+                'periodicity': 1,
+                'periodicity_display': "Monthly (1 times)",
+                'periodicity_type': "monthly",
+                'specification': "Export habit 2",
+                'completed_dates': ["2024-12-01"],
+                'current_streak': 1,
+                'longest_streak': 1
+            }
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'completions.bin')
+            self.tracker.export_completions(path)
+
+            # Read the columns back through the memory-mapped reader
+            with read_completions(path) as columns:
+                self.assertEqual(list(columns['habit_id']), [0, 0, 1])
+                self.assertEqual(list(columns['date_ordinal']), [
+                    datetime(2024, 11, 4).toordinal(),
+                    datetime(2024, 11, 5).toordinal(),
+                    datetime(2024, 12, 1).toordinal()
+                ])
+                self.assertEqual(list(columns['periodicity_type']), [0, 0, 2])
+
+    def export_sample(self, directory):
+        """Export a single habit with two completions and return the export path."""
+        self.tracker.habits_test = [{
+            'name': "Weekly Habit",
+            'periodicity': 1,
+            'periodicity_display': "Weekly (1 times)",
+            'periodicity_type': "weekly",
+            'specification': "Export habit",
+            'completed_dates': ["2024-11-04", "2024-11-11"],
+            'current_streak': 2,
+            'longest_streak': 2
+        }]
+        path = os.path.join(directory, 'completions.bin')
+        self.tracker.export_completions(path)
+        return path
+
+    def test_export_completions_invalid_habit(self):
+        """Test exporting habits with invalid data reports an error."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.export_sample(directory)
+            os.remove(path)
+
+            # An unknown periodicity and a malformed date should both be reported, not raised
+            self.tracker.habits_test[0]['periodicity_type'] = "hourly"
+            self.tracker.export_completions(path)
+            self.tracker.habits_test[0]['periodicity_type'] = "weekly"
+            self.tracker.habits_test[0]['completed_dates'] = ["04/11/2024"]
+            self.tracker.export_completions(path)
+
+            self.assertFalse(os.path.exists(path))
+
+    def test_read_completions_keeps_derived_views(self):
+        """Test a column slice kept past the reader does not break cleanup."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.export_sample(directory)
+            with read_completions(path) as columns:
+                tail = columns['habit_id'][1:]
+            self.assertEqual(list(tail), [0])
+            tail.release()
+
+    def test_read_completions_propagates_errors(self):
+        """Test errors raised inside the reader are not replaced."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.export_sample(directory)
+            with self.assertRaises(KeyError):
+                with read_completions(path) as columns:
+                    tail = columns['habit_id'][1:]
+                    columns['missing']
+            tail.release()
+
+    def test_read_completions_invalid_files(self):
+        """Test invalid export files raise ValueError."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.export_sample(directory)
+            with open(path, 'rb') as file:
+                data = file.read()
+
+            # Bad magic, truncated body, short header and an empty file
+            invalid_files = [b'XXXX' + data[4:], data[:-1], data[:6], b'']
+            for contents in invalid_files:
+                with open(path, 'wb') as file:
+                    file.write(contents)
+                with self.assertRaises(ValueError):
+                    with read_completions(path):
+                        pass
+
 
 if __name__ == '__main__':
     unittest.main()  # Run the test suite